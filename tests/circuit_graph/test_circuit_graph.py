@@ -24,7 +24,11 @@ from pennylane.circuit_graph import CircuitGraph
 from pennylane.wires import Wires
 
 
-@pytest.fixture
+_I4 = np.identity(4)
+_I4.flags.writeable = False
+
+
+@pytest.fixture(scope="module")
 def ops():
     """A fixture of a complex example of operations that depend on previous operations."""
     return [
@@ -38,23 +42,29 @@ def ops():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def obs():
     """A fixture of observables to go after the queue fixture."""
     return [
         qml.expval(qml.PauliX(wires=0)),
-        qml.expval(qml.Hermitian(np.identity(4), wires=[1, 2])),
+        qml.expval(qml.Hermitian(_I4, wires=[1, 2])),
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def circuit(ops, obs):
     """A fixture of a circuit generated based on the queue and obs fixtures above."""
     circuit = CircuitGraph(ops, obs, Wires([0, 1, 2]))
     return circuit
 
 
-@pytest.fixture
+@pytest.fixture(scope="module", params=[["a", "q1", 3]])
+def wires(request):
+    """A fixture of the wire labels used by the parametrized circuit."""
+    return request.param
+
+
+@pytest.fixture(scope="module")
 def parameterized_circuit(wires):
     def qfunc(a, b, c, d, e, f):
         qml.Rotation(a, wires=wires[0]),
@@ -74,6 +84,15 @@ def parameterized_circuit(wires):
     return qfunc
 
 
+@pytest.fixture(scope="module")
+def executed_graph(parameterized_circuit, wires):
+    """A fixture of the circuit graph of the parametrized circuit, evaluated once per module."""
+    dev = qml.device("default.gaussian", wires=wires)
+    qnode = qml.QNode(parameterized_circuit, dev)
+    qnode(0.1, 0.2, 0.3, 0.4, 0.5, 0.6)
+    return qnode.qtape.graph
+
+
 class TestCircuitGraph:
     """Test conversion of queues to DAGs"""
 
@@ -107,7 +126,8 @@ class TestCircuitGraph:
             assert k is queue[k.queue_idx]
 
         # Finally, checking the adjacency of the returned DAG:
-        assert set(graph.edges()) == set(
+        edges = sorted(graph.edges(), key=lambda e: (e[0].queue_idx, e[1].queue_idx))
+        assert edges == [
             (queue[a], queue[b])
             for a, b in [
                 (0, 3),
@@ -120,7 +140,7 @@ class TestCircuitGraph:
                 (5, 8),
                 (6, 8),
             ]
-        )
+        ]
 
     def test_ancestors_and_descendants_example(self, ops, obs):
         """
@@ -154,25 +174,18 @@ class TestCircuitGraph:
         """Test that the `operations` property returns the list of operations in the circuit."""
         assert circuit.operations == ops
 
-    def test_op_indices(self, circuit):
+    @pytest.mark.parametrize(
+        "wire, expected", [(0, [0, 3, 5, 7]), (1, [1, 3, 6, 8]), (2, [2, 4, 5, 8])]
+    )
+    def test_op_indices(self, circuit, wire, expected):
         """Test that for the given circuit, this method will fetch the correct operation indices for
         a given wire"""
-        op_indices_for_wire_0 = [0, 3, 5, 7]
-        op_indices_for_wire_1 = [1, 3, 6, 8]
-        op_indices_for_wire_2 = [2, 4, 5, 8]
-
-        assert circuit.wire_indices(0) == op_indices_for_wire_0
-        assert circuit.wire_indices(1) == op_indices_for_wire_1
-        assert circuit.wire_indices(2) == op_indices_for_wire_2
+        assert circuit.wire_indices(wire) == expected
 
-    @pytest.mark.parametrize("wires", [["a", "q1", 3]])
-    def test_layers(self, parameterized_circuit, wires):
+    def test_layers(self, executed_graph):
         """A test of a simple circuit with 3 layers and 6 parameters"""
 
-        dev = qml.device("default.gaussian", wires=wires)
-        qnode = qml.QNode(parameterized_circuit, dev)
-        qnode(0.1, 0.2, 0.3, 0.4, 0.5, 0.6)
-        circuit = qnode.qtape.graph
+        circuit = executed_graph
         layers = circuit.parametrized_layers
         ops = circuit.operations
 
@@ -184,28 +197,25 @@ class TestCircuitGraph:
         assert layers[2].ops == [ops[x] for x in [5, 6]]
         assert layers[2].param_inds == [6, 7]
 
-    @pytest.mark.parametrize("wires", [["a", "q1", 3]])
-    def test_iterate_layers(self, parameterized_circuit, wires):
+    def test_iterate_layers(self, executed_graph):
         """A test of the different layers, their successors and ancestors using a simple circuit"""
 
-        dev = qml.device("default.gaussian", wires=wires)
-        qnode = qml.QNode(parameterized_circuit, dev)
-        qnode(0.1, 0.2, 0.3, 0.4, 0.5, 0.6)
-        circuit = qnode.qtape.graph
+        circuit = executed_graph
         result = list(circuit.iterate_parametrized_layers())
 
+        # ancestors and descendants are returned sorted by queue index
         assert len(result) == 3
-        assert set(result[0][0]) == set([])
-        assert set(result[0][1]) == set(circuit.operations[:3])
+        assert result[0][0] == []
+        assert result[0][1] == circuit.operations[:3]
         assert result[0][2] == (0, 1, 2)
-        assert set(result[0][3]) == set(circuit.operations[3:] + circuit.observables)
+        assert result[0][3] == circuit.operations[3:] + circuit.observables
 
-        assert set(result[1][0]) == set(circuit.operations[:2])
-        assert set(result[1][1]) == set([circuit.operations[3]])
+        assert result[1][0] == circuit.operations[:2]
+        assert result[1][1] == [circuit.operations[3]]
         assert result[1][2] == (3,)
-        assert set(result[1][3]) == set(circuit.operations[4:6] + circuit.observables[:2])
+        assert result[1][3] == circuit.operations[4:6] + circuit.observables[:2]
 
-        assert set(result[2][0]) == set(circuit.operations[:4])
-        assert set(result[2][1]) == set(circuit.operations[5:])
+        assert result[2][0] == circuit.operations[:4]
+        assert result[2][1] == circuit.operations[5:]
         assert result[2][2] == (6, 7)
-        assert set(result[2][3]) == set(circuit.observables[1:])
+        assert result[2][3] == circuit.observables[1:]